@@ -1,627 +1,900 @@
-#!/usr/bin/env python3
-"""
-Home Directory Cleanup Tool
-Finds and helps delete: duplicates, empty files/folders, junk files, large files, and old files.
-"""
-
-import os
-import sys
-import hashlib
-import argparse
-import shutil
-from pathlib import Path
-from datetime import datetime, timedelta
-from collections import defaultdict
-from typing import Dict, List, Set, Tuple
-
-class Colors:
-    RED = '\033[91m'
-    GREEN = '\033[92m'
-    YELLOW = '\033[93m'
-    BLUE = '\033[94m'
-    MAGENTA = '\033[95m'
-    CYAN = '\033[96m'
-    BOLD = '\033[1m'
-    DIM = '\033[2m'
-    END = '\033[0m'
-
-
-# Directories to skip
-SKIP_DIRS = {
-    'Library', 'Applications', '.git', 'node_modules', '.ssh', '.config',
-    '.Trash', '.npm', '.cargo', '.rustup', '.pyenv', '.nvm', '.rbenv',
-    '.local', '.cache', '.vscode', '.idea', 'venv', '.venv', '__pycache__',
-    '.gradle', '.m2', '.docker', 'Movies', 'Music', 'Pictures', 'Photos Library.photoslibrary'
-}
-
-# Junk file patterns
-JUNK_EXTENSIONS = {
-    '.tmp', '.temp', '.log', '.bak', '.old', '.swp', '.swo',
-    '.DS_Store', '.Thumbs.db', '.thumbs.db', '.desktop.ini'
-}
-
-JUNK_NAMES = {
-    '.DS_Store', 'Thumbs.db', 'desktop.ini', '.localized',
-    '.CFUserTextEncoding', '.Spotlight-V100', '.fseventsd'
-}
-
-JUNK_PREFIXES = {'._', '~$', '.~'}
-
-
-class CleanupScanner:
-    def __init__(self, root_path: Path, large_threshold_mb: int = 100, old_days: int = 120):
-        self.root_path = root_path
-        self.large_threshold = large_threshold_mb * 1024 * 1024  # Convert to bytes
-        self.old_threshold = datetime.now() - timedelta(days=old_days)
-        self.old_days = old_days
-
-        # Results
-        self.duplicates: Dict[str, List[Path]] = defaultdict(list)
-        self.empty_files: List[Path] = []
-        self.empty_dirs: List[Path] = []
-        self.junk_files: List[Path] = []
-        self.large_files: List[Tuple[Path, int]] = []
-        self.old_files: List[Tuple[Path, datetime]] = []
-
-        # Stats
-        self.files_scanned = 0
-        self.dirs_scanned = 0
-        self.total_size_scanned = 0
-
-    def should_skip(self, path: Path) -> bool:
-        """Check if path should be skipped."""
-        for part in path.parts:
-            if part in SKIP_DIRS:
-                return True
-        return False
-
-    def is_junk_file(self, path: Path) -> bool:
-        """Check if file is a junk file."""
-        name = path.name
-        suffix = path.suffix.lower()
-
-        if name in JUNK_NAMES:
-            return True
-        if suffix in JUNK_EXTENSIONS:
-            return True
-        if name == '.DS_Store':
-            return True
-        for prefix in JUNK_PREFIXES:
-            if name.startswith(prefix):
-                return True
-        return False
-
-    def get_file_hash(self, filepath: Path, quick: bool = True) -> str:
-        """Calculate file hash. Quick mode only hashes first/last 4KB."""
-        hasher = hashlib.md5()
-        try:
-            file_size = filepath.stat().st_size
-            with open(filepath, 'rb') as f:
-                if quick and file_size > 8192:
-                    # Hash first 4KB
-                    hasher.update(f.read(4096))
-                    # Hash last 4KB
-                    f.seek(-4096, 2)
-                    hasher.update(f.read(4096))
-                    # Include size in hash for quick mode
-                    hasher.update(str(file_size).encode())
-                else:
-                    # Hash entire file for small files
-                    for chunk in iter(lambda: f.read(65536), b''):
-                        hasher.update(chunk)
-            return hasher.hexdigest()
-        except (IOError, OSError):
-            return ""
-
-    def scan(self) -> None:
-        """Scan the directory for cleanup candidates."""
-        print(f"\n{Colors.BOLD}{Colors.CYAN}Scanning {self.root_path}...{Colors.END}\n")
-
-        # First pass: collect all files
-        all_files: List[Tuple[Path, int, datetime]] = []
-
-        for root, dirs, files in os.walk(self.root_path):
-            root_path = Path(root)
-
-            # Skip excluded directories
-            if self.should_skip(root_path):
-                dirs.clear()
-                continue
-
-            # Filter out skip dirs from traversal
-            dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
-
-            self.dirs_scanned += 1
-
-            # Check for empty directory
-            if not dirs and not files:
-                self.empty_dirs.append(root_path)
-
-            # Process files
-            for filename in files:
-                filepath = root_path / filename
-
-                try:
-                    stat = filepath.stat()
-                    file_size = stat.st_size
-                    mtime = datetime.fromtimestamp(stat.st_mtime)
-
-                    self.files_scanned += 1
-                    self.total_size_scanned += file_size
-
-                    # Progress indicator
-                    if self.files_scanned % 500 == 0:
-                        print(f"  Scanned {self.files_scanned:,} files...", end='\r')
-
-                    all_files.append((filepath, file_size, mtime))
-
-                    # Check categories
-                    if file_size == 0:
-                        self.empty_files.append(filepath)
-                    elif self.is_junk_file(filepath):
-                        self.junk_files.append(filepath)
-                    else:
-                        # Check for large files
-                        if file_size >= self.large_threshold:
-                            self.large_files.append((filepath, file_size))
-
-                        # Check for old files
-                        if mtime < self.old_threshold:
-                            self.old_files.append((filepath, mtime))
-
-                except (IOError, OSError, PermissionError):
-                    continue
-
-        print(f"  Scanned {self.files_scanned:,} files in {self.dirs_scanned:,} directories")
-
-        # Second pass: find duplicates (only for non-empty, non-junk files > 1KB)
-        print(f"\n{Colors.CYAN}Finding duplicates...{Colors.END}")
-
-        # Group by size first (quick filter)
-        size_groups: Dict[int, List[Tuple[Path, datetime]]] = defaultdict(list)
-        for filepath, file_size, mtime in all_files:
-            if file_size > 1024 and not self.is_junk_file(filepath):
-                size_groups[file_size].append((filepath, mtime))
-
-        # For files with same size, compare hashes
-        hash_count = 0
-        potential_dups = [(size, files) for size, files in size_groups.items() if len(files) > 1]
-
-        for size, files in potential_dups:
-            hash_groups: Dict[str, List[Tuple[Path, datetime]]] = defaultdict(list)
-
-            for filepath, mtime in files:
-                file_hash = self.get_file_hash(filepath)
-                if file_hash:
-                    hash_groups[file_hash].append((filepath, mtime))
-                    hash_count += 1
-                    if hash_count % 100 == 0:
-                        print(f"  Hashed {hash_count:,} potential duplicates...", end='\r')
-
-            # Files with same hash are duplicates
-            for file_hash, dup_files in hash_groups.items():
-                if len(dup_files) > 1:
-                    # Sort by mtime (newest first) - we'll keep the newest
-                    dup_files.sort(key=lambda x: x[1], reverse=True)
-                    self.duplicates[file_hash] = [f[0] for f in dup_files]
-
-        print(f"  Hashed {hash_count:,} files for duplicate detection")
-
-        # Sort results
-        self.large_files.sort(key=lambda x: x[1], reverse=True)
-        self.old_files.sort(key=lambda x: x[1])
-
-    def format_size(self, size: int) -> str:
-        """Format size in human-readable format."""
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-            if size < 1024:
-                return f"{size:.1f} {unit}"
-            size /= 1024
-        return f"{size:.1f} PB"
-
-    def format_age(self, mtime: datetime) -> str:
-        """Format file age."""
-        age = datetime.now() - mtime
-        if age.days > 365:
-            years = age.days // 365
-            return f"{years} year{'s' if years > 1 else ''} ago"
-        elif age.days > 30:
-            months = age.days // 30
-            return f"{months} month{'s' if months > 1 else ''} ago"
-        else:
-            return f"{age.days} days ago"
-
-    def get_duplicate_size(self) -> int:
-        """Calculate total size of duplicate files (excluding originals)."""
-        total = 0
-        for files in self.duplicates.values():
-            for filepath in files[1:]:  # Skip first (newest, kept)
-                try:
-                    total += filepath.stat().st_size
-                except:
-                    pass
-        return total
-
-    def print_summary(self) -> None:
-        """Print summary of findings."""
-        print(f"\n{Colors.BOLD}{'=' * 70}")
-        print(f"                         SCAN SUMMARY")
-        print(f"{'=' * 70}{Colors.END}\n")
-
-        print(f"  {Colors.CYAN}Total scanned:{Colors.END} {self.files_scanned:,} files, {self.format_size(self.total_size_scanned)}")
-        print()
-
-        categories = [
-            ("1", "Duplicate files", len(self.duplicates), self.get_duplicate_size(), Colors.RED),
-            ("2", "Empty files", len(self.empty_files), 0, Colors.YELLOW),
-            ("3", "Empty directories", len(self.empty_dirs), 0, Colors.YELLOW),
-            ("4", "Junk files", len(self.junk_files), sum(f.stat().st_size for f in self.junk_files if f.exists()), Colors.MAGENTA),
-            ("5", "Large files (>100MB)", len(self.large_files), sum(s for _, s in self.large_files), Colors.BLUE),
-            ("6", f"Old files (>{self.old_days} days)", len(self.old_files), sum(f.stat().st_size for f, _ in self.old_files if f.exists()), Colors.GREEN),
-        ]
-
-        for num, name, count, size, color in categories:
-            if count > 0:
-                size_str = f" ({self.format_size(size)})" if size > 0 else ""
-                print(f"  {Colors.BOLD}[{num}]{Colors.END} {color}{name}:{Colors.END} {count:,} items{size_str}")
-            else:
-                print(f"  {Colors.DIM}[{num}] {name}: None found{Colors.END}")
-
-        print()
-
-    def print_category_details(self, category: str, limit: int = 20) -> None:
-        """Print details for a specific category."""
-        if category == "1" and self.duplicates:
-            print(f"\n{Colors.BOLD}{Colors.RED}DUPLICATE FILES{Colors.END}")
-            print(f"{Colors.DIM}(First file in each group will be KEPT, others deleted){Colors.END}\n")
-
-            shown = 0
-            for file_hash, files in list(self.duplicates.items())[:limit]:
-                size = self.format_size(files[0].stat().st_size) if files[0].exists() else "?"
-                print(f"  {Colors.GREEN}[KEEP]{Colors.END} {files[0]}")
-                for dup in files[1:]:
-                    print(f"  {Colors.RED}[DEL]{Colors.END}  {dup}")
-                print(f"  {Colors.DIM}Size: {size}{Colors.END}\n")
-                shown += 1
-
-            if len(self.duplicates) > limit:
-                print(f"  {Colors.DIM}... and {len(self.duplicates) - limit} more duplicate groups{Colors.END}\n")
-
-        elif category == "2" and self.empty_files:
-            print(f"\n{Colors.BOLD}{Colors.YELLOW}EMPTY FILES{Colors.END}\n")
-            for f in self.empty_files[:limit]:
-                print(f"  {f}")
-            if len(self.empty_files) > limit:
-                print(f"  {Colors.DIM}... and {len(self.empty_files) - limit} more{Colors.END}")
-            print()
-
-        elif category == "3" and self.empty_dirs:
-            print(f"\n{Colors.BOLD}{Colors.YELLOW}EMPTY DIRECTORIES{Colors.END}\n")
-            for d in self.empty_dirs[:limit]:
-                print(f"  {d}")
-            if len(self.empty_dirs) > limit:
-                print(f"  {Colors.DIM}... and {len(self.empty_dirs) - limit} more{Colors.END}")
-            print()
-
-        elif category == "4" and self.junk_files:
-            print(f"\n{Colors.BOLD}{Colors.MAGENTA}JUNK FILES{Colors.END}\n")
-            for f in self.junk_files[:limit]:
-                size = self.format_size(f.stat().st_size) if f.exists() else "?"
-                print(f"  {f} {Colors.DIM}({size}){Colors.END}")
-            if len(self.junk_files) > limit:
-                print(f"  {Colors.DIM}... and {len(self.junk_files) - limit} more{Colors.END}")
-            print()
-
-        elif category == "5" and self.large_files:
-            print(f"\n{Colors.BOLD}{Colors.BLUE}LARGE FILES (>100MB){Colors.END}\n")
-            for f, size in self.large_files[:limit]:
-                print(f"  {self.format_size(size):>10}  {f}")
-            if len(self.large_files) > limit:
-                print(f"  {Colors.DIM}... and {len(self.large_files) - limit} more{Colors.END}")
-            print()
-
-        elif category == "6" and self.old_files:
-            print(f"\n{Colors.BOLD}{Colors.GREEN}OLD FILES (>{self.old_days} days){Colors.END}\n")
-            for f, mtime in self.old_files[:limit]:
-                age = self.format_age(mtime)
-                size = self.format_size(f.stat().st_size) if f.exists() else "?"
-                print(f"  {age:>18}  {size:>10}  {f}")
-            if len(self.old_files) > limit:
-                print(f"  {Colors.DIM}... and {len(self.old_files) - limit} more{Colors.END}")
-            print()
-
-    def get_files_for_category(self, category: str) -> List[Path]:
-        """Get list of files to delete for a category."""
-        if category == "1":
-            # For duplicates, return all but the newest (first) in each group
-            files = []
-            for file_list in self.duplicates.values():
-                files.extend(file_list[1:])
-            return files
-        elif category == "2":
-            return self.empty_files
-        elif category == "3":
-            return self.empty_dirs
-        elif category == "4":
-            return self.junk_files
-        elif category == "5":
-            return [f for f, _ in self.large_files]
-        elif category == "6":
-            return [f for f, _ in self.old_files]
-        return []
-
-
-class Cleaner:
-    def __init__(self, backup_dir: Path = None):
-        self.backup_dir = backup_dir
-        self.deleted_count = 0
-        self.deleted_size = 0
-        self.failed_count = 0
-
-    def delete_file(self, filepath: Path, backup: bool = False) -> bool:
-        """Delete or backup a file."""
-        try:
-            if not filepath.exists():
-                return True
-
-            file_size = filepath.stat().st_size if filepath.is_file() else 0
-
-            if backup and self.backup_dir:
-                # Create backup path preserving directory structure
-                rel_path = filepath.relative_to(Path.home())
-                backup_path = self.backup_dir / rel_path
-                backup_path.parent.mkdir(parents=True, exist_ok=True)
-
-                # Handle name conflicts
-                if backup_path.exists():
-                    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                    backup_path = backup_path.with_name(f"{backup_path.stem}_{timestamp}{backup_path.suffix}")
-
-                shutil.move(str(filepath), str(backup_path))
-            else:
-                if filepath.is_dir():
-                    filepath.rmdir()
-                else:
-                    filepath.unlink()
-
-            self.deleted_count += 1
-            self.deleted_size += file_size
-            return True
-
-        except Exception as e:
-            self.failed_count += 1
-            return False
-
-    def clean_category(self, files: List[Path], backup: bool = False) -> Tuple[int, int, int]:
-        """Clean files in a category. Returns (deleted, failed, size)."""
-        self.deleted_count = 0
-        self.deleted_size = 0
-        self.failed_count = 0
-
-        total = len(files)
-        for i, filepath in enumerate(files):
-            self.delete_file(filepath, backup)
-            if (i + 1) % 50 == 0:
-                print(f"  Progress: {i + 1}/{total}", end='\r')
-
-        print(f"  Progress: {total}/{total}  ")
-        return self.deleted_count, self.failed_count, self.deleted_size
-
-
-def confirm(message: str) -> bool:
-    """Ask user for confirmation."""
-    while True:
-        response = input(f"{message} {Colors.YELLOW}[y/N]:{Colors.END} ").strip().lower()
-        if response in ('y', 'yes'):
-            return True
-        if response in ('n', 'no', ''):
-            return False
-
-
-def format_size(size: int) -> str:
-    """Format size in human-readable format."""
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if size < 1024:
-            return f"{size:.1f} {unit}"
-        size /= 1024
-    return f"{size:.1f} PB"
-
-
-def main():
-    parser = argparse.ArgumentParser(
-        description="Clean up your home directory by finding and removing unwanted files.",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Categories:
-  1. Duplicates    - Files with identical content (keeps newest)
-  2. Empty files   - Zero-byte files
-  3. Empty dirs    - Directories with no content
-  4. Junk files    - .tmp, .log, .DS_Store, .bak, etc.
-  5. Large files   - Files over 100MB
-  6. Old files     - Not modified in 120+ days
-
-Examples:
-  %(prog)s                      # Scan and interactive cleanup
-  %(prog)s --backup             # Move to ~/.cleanup_backup instead of delete
-  %(prog)s --large-mb 500       # Set large file threshold to 500MB
-  %(prog)s --old-days 180       # Set old file threshold to 180 days
-        """
-    )
-
-    parser.add_argument(
-        '--path',
-        type=Path,
-        default=Path.home(),
-        help='Directory to clean (default: home directory)'
-    )
-    parser.add_argument(
-        '--backup',
-        action='store_true',
-        help='Move files to ~/.cleanup_backup instead of deleting'
-    )
-    parser.add_argument(
-        '--large-mb',
-        type=int,
-        default=100,
-        help='Threshold for large files in MB (default: 100)'
-    )
-    parser.add_argument(
-        '--old-days',
-        type=int,
-        default=120,
-        help='Threshold for old files in days (default: 120)'
-    )
-    parser.add_argument(
-        '--show-all',
-        action='store_true',
-        help='Show all items (no limit) in category details'
-    )
-
-    args = parser.parse_args()
-
-    # Banner
-    print(f"\n{Colors.BOLD}{Colors.CYAN}{'=' * 70}")
-    print(f"               HOME DIRECTORY CLEANUP TOOL")
-    print(f"{'=' * 70}{Colors.END}")
-
-    if args.backup:
-        backup_dir = Path.home() / '.cleanup_backup'
-        print(f"\n{Colors.GREEN}Backup mode enabled:{Colors.END} Files will be moved to {backup_dir}")
-    else:
-        backup_dir = None
-        print(f"\n{Colors.YELLOW}Warning:{Colors.END} Files will be permanently deleted!")
-
-    # Scan
-    scanner = CleanupScanner(args.path, args.large_mb, args.old_days)
-    scanner.scan()
-    scanner.print_summary()
-
-    # Check if anything was found
-    total_items = (len(scanner.duplicates) + len(scanner.empty_files) +
-                   len(scanner.empty_dirs) + len(scanner.junk_files) +
-                   len(scanner.large_files) + len(scanner.old_files))
-
-    if total_items == 0:
-        print(f"{Colors.GREEN}Your home directory is clean! Nothing to do.{Colors.END}\n")
-        return
-
-    # Interactive menu
-    cleaner = Cleaner(backup_dir)
-    display_limit = None if args.show_all else 20
-
-    while True:
-        print(f"\n{Colors.BOLD}OPTIONS:{Colors.END}")
-        print(f"  {Colors.CYAN}[1-6]{Colors.END}  View details for a category")
-        print(f"  {Colors.CYAN}[d1-d6]{Colors.END} Delete/backup items in a category")
-        print(f"  {Colors.CYAN}[a]{Colors.END}    Delete/backup ALL categories")
-        print(f"  {Colors.CYAN}[r]{Colors.END}    Rescan directory")
-        print(f"  {Colors.CYAN}[q]{Colors.END}    Quit")
-
-        choice = input(f"\n{Colors.BOLD}Enter choice:{Colors.END} ").strip().lower()
-
-        if choice == 'q':
-            print(f"\n{Colors.GREEN}Goodbye!{Colors.END}\n")
-            break
-
-        elif choice == 'r':
-            scanner = CleanupScanner(args.path, args.large_mb, args.old_days)
-            scanner.scan()
-            scanner.print_summary()
-
-        elif choice in ['1', '2', '3', '4', '5', '6']:
-            scanner.print_category_details(choice, display_limit or 1000)
-
-        elif choice.startswith('d') and choice[1:] in ['1', '2', '3', '4', '5', '6']:
-            category = choice[1:]
-            files = scanner.get_files_for_category(category)
-
-            if not files:
-                print(f"\n{Colors.YELLOW}No items in this category.{Colors.END}")
-                continue
-
-            category_names = {
-                "1": "duplicate files",
-                "2": "empty files",
-                "3": "empty directories",
-                "4": "junk files",
-                "5": "large files",
-                "6": "old files"
-            }
-
-            action = "move to backup" if args.backup else "permanently delete"
-            print(f"\n{Colors.RED}About to {action} {len(files)} {category_names[category]}.{Colors.END}")
-
-            if confirm(f"Are you sure?"):
-                if args.backup:
-                    backup_dir.mkdir(parents=True, exist_ok=True)
-
-                deleted, failed, size = cleaner.clean_category(files, args.backup)
-
-                print(f"\n{Colors.GREEN}Completed:{Colors.END}")
-                print(f"  {'Moved' if args.backup else 'Deleted'}: {deleted} items ({format_size(size)})")
-                if failed:
-                    print(f"  {Colors.RED}Failed: {failed} items{Colors.END}")
-
-                # Clear the cleaned category
-                if category == "1":
-                    scanner.duplicates.clear()
-                elif category == "2":
-                    scanner.empty_files.clear()
-                elif category == "3":
-                    scanner.empty_dirs.clear()
-                elif category == "4":
-                    scanner.junk_files.clear()
-                elif category == "5":
-                    scanner.large_files.clear()
-                elif category == "6":
-                    scanner.old_files.clear()
-            else:
-                print(f"\n{Colors.YELLOW}Cancelled.{Colors.END}")
-
-        elif choice == 'a':
-            all_files = []
-            for cat in ['1', '2', '3', '4', '5', '6']:
-                all_files.extend(scanner.get_files_for_category(cat))
-
-            if not all_files:
-                print(f"\n{Colors.YELLOW}Nothing to clean.{Colors.END}")
-                continue
-
-            action = "move to backup" if args.backup else "permanently delete"
-            print(f"\n{Colors.RED}About to {action} {len(all_files)} items from ALL categories.{Colors.END}")
-            print(f"{Colors.RED}This includes duplicates, empty files/dirs, junk, large, and old files!{Colors.END}")
-
-            if confirm("Are you ABSOLUTELY sure?"):
-                if confirm("Last chance - this cannot be undone. Continue?"):
-                    if args.backup:
-                        backup_dir.mkdir(parents=True, exist_ok=True)
-
-                    deleted, failed, size = cleaner.clean_category(all_files, args.backup)
-
-                    print(f"\n{Colors.GREEN}Completed:{Colors.END}")
-                    print(f"  {'Moved' if args.backup else 'Deleted'}: {deleted} items ({format_size(size)})")
-                    if failed:
-                        print(f"  {Colors.RED}Failed: {failed} items{Colors.END}")
-
-                    # Clear all categories
-                    scanner.duplicates.clear()
-                    scanner.empty_files.clear()
-                    scanner.empty_dirs.clear()
-                    scanner.junk_files.clear()
-                    scanner.large_files.clear()
-                    scanner.old_files.clear()
-                else:
-                    print(f"\n{Colors.YELLOW}Cancelled.{Colors.END}")
-            else:
-                print(f"\n{Colors.YELLOW}Cancelled.{Colors.END}")
-
-        else:
-            print(f"\n{Colors.YELLOW}Invalid choice. Try again.{Colors.END}")
-
-
-if __name__ == "__main__":
-    try:
-        main()
-    except KeyboardInterrupt:
-        print(f"\n\n{Colors.YELLOW}Cancelled by user.{Colors.END}\n")
-        sys.exit(0)
+#!/usr/bin/env python3
+"""
+Home Directory Cleanup Tool
+Finds and helps delete: duplicates, empty files/folders, junk files, large files, and old files.
+"""
+
+import os
+import sys
+import array
+import hashlib
+import argparse
+import functools
+import itertools
+import queue
+import re
+import shutil
+import stat
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from datetime import datetime, timedelta
+from collections import defaultdict
+from typing import Dict, List, Set, Tuple
+
+# Optional fast hashers: duplicate detection only needs collision resistance
+# against accidental matches, not cryptographic strength.
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+# Optional: vectorized sorts over the packed result columns
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+class Colors:
+    RED = '\033[91m'
+    GREEN = '\033[92m'
+    YELLOW = '\033[93m'
+    BLUE = '\033[94m'
+    MAGENTA = '\033[95m'
+    CYAN = '\033[96m'
+    BOLD = '\033[1m'
+    DIM = '\033[2m'
+    END = '\033[0m'
+
+
+# Directories to skip
+SKIP_DIRS = {
+    'Library', 'Applications', '.git', 'node_modules', '.ssh', '.config',
+    '.Trash', '.npm', '.cargo', '.rustup', '.pyenv', '.nvm', '.rbenv',
+    '.local', '.cache', '.vscode', '.idea', 'venv', '.venv', '__pycache__',
+    '.gradle', '.m2', '.docker', 'Movies', 'Music', 'Pictures', 'Photos Library.photoslibrary'
+}
+
+# Junk file patterns
+JUNK_EXTENSIONS = {
+    '.tmp', '.temp', '.log', '.bak', '.old', '.swp', '.swo',
+    '.DS_Store', '.Thumbs.db', '.thumbs.db', '.desktop.ini'
+}
+
+JUNK_NAMES = {
+    '.DS_Store', 'Thumbs.db', 'desktop.ini', '.localized',
+    '.CFUserTextEncoding', '.Spotlight-V100', '.fseventsd'
+}
+
+# Tuple so str.startswith can test all prefixes in one C call
+JUNK_PREFIXES = ('._', '~$', '.~')
+
+# The whole junk vocabulary compiled into one alternation: classification is
+# a single linear pass over the name instead of set probes plus a prefix
+# loop. Extensions match case-insensitively (as the old .lower() did) and
+# need at least one character before the dot, mirroring Path.suffix.
+JUNK_RE = re.compile(
+    r'^(?:' + '|'.join(map(re.escape, sorted(JUNK_NAMES))) + r')$'
+    r'|^(?:' + '|'.join(map(re.escape, JUNK_PREFIXES)) + r')'
+    r'|.(?i:' + '|'.join(map(re.escape, sorted(JUNK_EXTENSIONS))) + r')$'
+)
+
+
+def _sort_indices(indices: array.array, column: array.array,
+                  reverse: bool = False) -> array.array:
+    """Order an index array by its backing column.
+
+    With numpy the comparison sort runs vectorized in C over the packed
+    column; otherwise fall back to sorted() with a column lookup key.
+    """
+    if np is not None and len(indices) > 1:
+        sel = np.frombuffer(indices, dtype=np.uint32)
+        dtype = np.int64 if column.typecode == 'q' else np.float64
+        keys = np.frombuffer(column, dtype=dtype)[sel]
+        order = np.argsort(-keys if reverse else keys, kind='stable')
+        out = array.array('I')
+        out.frombytes(sel[order].astype(np.uint32).tobytes())
+        return out
+    return array.array('I', sorted(indices, key=column.__getitem__, reverse=reverse))
+
+
+class CleanupScanner:
+    def __init__(self, root_path: Path, large_threshold_mb: int = 100, old_days: int = 120,
+                 min_dup_bucket_bytes: int = 1024 * 1024):
+        self.root_path = root_path
+        self.large_threshold = large_threshold_mb * 1024 * 1024  # Convert to bytes
+        self.old_threshold = datetime.now() - timedelta(days=old_days)
+        self.old_days = old_days
+        # Epoch form of the threshold: the scan compares raw st_mtime floats
+        # against this instead of building a datetime per file
+        self.old_threshold_epoch = self.old_threshold.timestamp()
+        self.min_dup_bucket_bytes = min_dup_bucket_bytes
+
+        # Scan results in columnar (struct-of-arrays) form: one str list
+        # plus packed native arrays instead of millions of per-file tuples,
+        # Path objects and boxed ints. Categories hold indices into _paths.
+        self._paths: List[str] = []
+        self._sizes = array.array('q')
+        self._mtimes = array.array('d')
+        self._devs = array.array('Q')
+        self._inos = array.array('Q')
+        self._junk_flags = array.array('b')
+
+        # Results (duplicates carry the per-file size captured at scan time)
+        self.duplicates: Dict[str, Tuple[int, List[Path]]] = {}
+        self.empty_files = array.array('I')
+        self.empty_dirs: List[Path] = []
+        self.junk_files = array.array('I')
+        self.large_files = array.array('I')
+        self.old_files = array.array('I')
+
+        # Stats
+        self.files_scanned = 0
+        self.dirs_scanned = 0
+        self.total_size_scanned = 0
+
+        # monotonic timestamp of the last progress line written
+        self._last_progress = 0.0
+
+    def _progress(self, message: str) -> None:
+        """Write a carriage-return progress line, rate-limited to ~5 Hz.
+
+        A cheap clock check replaces a modulo + print per file, and a slow
+        terminal (e.g. over SSH) can never back-pressure the scan threads.
+        """
+        now = time.monotonic()
+        if now - self._last_progress >= 0.2:
+            self._last_progress = now
+            # Trailing \r (as the baseline prints did) returns the cursor
+            # to column 0 so the next regular print overwrites this line
+            sys.stdout.write(f"{message}\r")
+            sys.stdout.flush()
+
+    @staticmethod
+    @functools.lru_cache(maxsize=65536)
+    def is_junk_file(name: str) -> bool:
+        """Check if filename is a junk file (operates on the bare name).
+
+        Memoized: the same names (.DS_Store, ._*, *.log, ...) repeat across
+        directories, and the check runs once per file scanned.
+        """
+        return JUNK_RE.search(name) is not None
+
+    def _new_hasher(self, file_size: int):
+        """Pick the fastest available hasher for a file of the given size.
+
+        BLAKE3 (SIMD, internally threaded) for large files, xxh3 for small
+        ones; falls back to MD5 when neither package is installed.
+        """
+        if blake3 is not None and file_size >= 1 << 20:
+            return blake3.blake3(max_threads=blake3.blake3.AUTO)
+        if xxhash is not None:
+            return xxhash.xxh3_128()
+        if blake3 is not None:
+            return blake3.blake3()
+        return hashlib.md5(usedforsecurity=False)
+
+    def _head_hash(self, filepath: str, head_cache: Dict[str, bytes]) -> str:
+        """Tier 1: hash only the first 4KB (cached for the later tiers)."""
+        try:
+            fd = os.open(filepath, os.O_RDONLY)
+            try:
+                head = os.pread(fd, 4096, 0)
+            finally:
+                os.close(fd)
+            head_cache[filepath] = head
+            hasher = self._new_hasher(len(head))
+            hasher.update(head)
+            return hasher.hexdigest()
+        except (IOError, OSError):
+            return ""
+
+    def _head_tail_hash(self, filepath: str, file_size: int,
+                        head_cache: Dict[str, bytes]) -> str:
+        """Tier 2: hash sampled anchors — cached head, middle (for files over
+        32KB, since structured binaries share headers/trailers), and tail.
+
+        pread on a raw fd: one syscall per sampled block, no seek round
+        trips and no buffered-I/O layer in between.
+        """
+        try:
+            hasher = self._new_hasher(file_size)
+            head = head_cache.get(filepath)
+            fd = None
+            try:
+                if head is None:
+                    fd = os.open(filepath, os.O_RDONLY)
+                    head = os.pread(fd, 4096, 0)
+                hasher.update(head)
+                if file_size > 4096:
+                    if fd is None:
+                        fd = os.open(filepath, os.O_RDONLY)
+                    if file_size > 32768:
+                        hasher.update(os.pread(fd, 4096, (file_size // 2) - 2048))
+                    hasher.update(os.pread(fd, 4096, file_size - 4096))
+            finally:
+                if fd is not None:
+                    os.close(fd)
+            hasher.update(str(file_size).encode())
+            return hasher.hexdigest()
+        except (IOError, OSError):
+            return ""
+
+    def _full_hash(self, filepath: str) -> str:
+        """Tier 3: hash the entire file contents.
+
+        file_digest (3.11+) runs the chunked read loop in C against one
+        reused buffer — no per-chunk method dispatch, bytes allocation, or
+        refcount traffic.
+        """
+        try:
+            hasher = self._new_hasher(os.stat(filepath).st_size)
+            with open(filepath, 'rb') as f:
+                if hasattr(hashlib, 'file_digest'):
+                    return hashlib.file_digest(f, lambda: hasher).hexdigest()
+                for chunk in iter(lambda: f.read(65536), b''):
+                    hasher.update(chunk)
+            return hasher.hexdigest()
+        except (IOError, OSError):
+            return ""
+
+    def scan(self) -> None:
+        """Scan the directory for cleanup candidates."""
+        print(f"\n{Colors.BOLD}{Colors.CYAN}Scanning {self.root_path}...{Colors.END}\n")
+
+        # Single pass: walk the tree with scandir so each entry is stat'ed
+        # exactly once, appending straight into columnar arrays — no per-file
+        # tuples or Path objects in the hot loop. Directories are fed through
+        # a queue to a pool of workers so multiple readdir/stat calls are in
+        # flight at once; each worker accumulates into local columns that are
+        # merged (with indices rebased) under one lock at shutdown.
+        old_epoch = self.old_threshold_epoch
+
+        work: queue.Queue = queue.Queue()
+        # Skip dirs are pruned at descent time inside the workers; the only
+        # ancestor walk left is this one, run once for the scan root itself.
+        if not any(part in SKIP_DIRS for part in self.root_path.parts):
+            work.put(str(self.root_path))
+        merge_lock = threading.Lock()
+        progress = itertools.count(1)
+        n_workers = min(32, (os.cpu_count() or 4) * 2)
+
+        def worker() -> None:
+            paths: List[str] = []
+            sizes = array.array('q')
+            mtimes = array.array('d')
+            devs = array.array('Q')
+            inos = array.array('Q')
+            junk_flags = array.array('b')
+            empty_idx = array.array('I')
+            junk_idx = array.array('I')
+            large_idx = array.array('I')
+            old_idx = array.array('I')
+            empty_dirs: List[Path] = []
+            dirs_done = 0
+            size_total = 0
+
+            while True:
+                dirpath = work.get()
+                if dirpath is None:
+                    work.task_done()
+                    break
+
+                dirs_done += 1
+                n_entries = 0
+
+                try:
+                    with os.scandir(dirpath) as entries:
+                        for entry in entries:
+                            n_entries += 1
+
+                            try:
+                                if entry.is_dir(follow_symlinks=False):
+                                    # Never descend into skip dirs at all
+                                    if entry.name not in SKIP_DIRS:
+                                        work.put(entry.path)
+                                    continue
+                                stat = entry.stat(follow_symlinks=False)
+                            except OSError:
+                                continue
+
+                            file_size = stat.st_size
+                            mtime = stat.st_mtime
+                            size_total += file_size
+
+                            # Progress indicator (itertools.count is atomic in CPython)
+                            scanned = next(progress)
+                            self._progress(f"  Scanned {scanned:,} files...")
+
+                            # Check categories (junk decided once, stored in
+                            # the junk column so the duplicate pass never
+                            # re-checks)
+                            idx = len(paths)
+                            is_junk = False
+                            if file_size == 0:
+                                empty_idx.append(idx)
+                            elif self.is_junk_file(entry.name):
+                                is_junk = True
+                                junk_idx.append(idx)
+                            else:
+                                # Check for large files
+                                if file_size >= self.large_threshold:
+                                    large_idx.append(idx)
+
+                                # Check for old files
+                                if mtime < old_epoch:
+                                    old_idx.append(idx)
+
+                            paths.append(entry.path)
+                            sizes.append(file_size)
+                            mtimes.append(mtime)
+                            devs.append(stat.st_dev)
+                            inos.append(stat.st_ino)
+                            junk_flags.append(is_junk)
+                except OSError:
+                    pass
+                else:
+                    # Only a successfully listed directory can be called
+                    # empty — an unreadable one might hold anything
+                    if n_entries == 0:
+                        empty_dirs.append(Path(dirpath))
+                work.task_done()
+
+            with merge_lock:
+                base = len(self._paths)
+                self._paths.extend(paths)
+                self._sizes.extend(sizes)
+                self._mtimes.extend(mtimes)
+                self._devs.extend(devs)
+                self._inos.extend(inos)
+                self._junk_flags.extend(junk_flags)
+                self.empty_files.extend(base + i for i in empty_idx)
+                self.junk_files.extend(base + i for i in junk_idx)
+                self.large_files.extend(base + i for i in large_idx)
+                self.old_files.extend(base + i for i in old_idx)
+                self.empty_dirs.extend(empty_dirs)
+                self.files_scanned += len(paths)
+                self.dirs_scanned += dirs_done
+                self.total_size_scanned += size_total
+
+        with ThreadPoolExecutor(max_workers=n_workers) as executor:
+            workers = [executor.submit(worker) for _ in range(n_workers)]
+            work.join()
+            for _ in range(n_workers):
+                work.put(None)
+            for w in workers:
+                w.result()
+
+        print(f"  Scanned {self.files_scanned:,} files in {self.dirs_scanned:,} directories")
+
+        # Second pass: find duplicates (only for non-empty, non-junk files > 1KB)
+        print(f"\n{Colors.CYAN}Finding duplicates...{Colors.END}")
+
+        # Group by size first (quick filter): sort index order once and
+        # groupby on the size column, a linear scan with no dict probe or
+        # list append per file. The junk bit was decided during the scan pass.
+        sizes = self._sizes
+        by_size = sorted(range(len(self._paths)), key=sizes.__getitem__)
+        potential_dups: List[Tuple[int, List[List[Tuple[str, float]]]]] = []
+        for file_size, group in itertools.groupby(by_size, key=sizes.__getitem__):
+            if file_size <= 1024:
+                continue
+
+            # Collapse hardlinks first: entries sharing (dev, ino) are the
+            # same data on disk, so hashing more than one of them is wasted
+            # I/O — keep the whole link cluster and hash one representative.
+            inode_groups: Dict[Tuple[int, int], List[Tuple[str, float]]] = defaultdict(list)
+            for i in group:
+                if not self._junk_flags[i]:
+                    inode_groups[(self._devs[i], self._inos[i])].append(
+                        (self._paths[i], self._mtimes[i]))
+
+            # Skip buckets whose aggregate potential reclaim is noise:
+            # hashing dozens of same-size small files costs real I/O but
+            # can never free meaningful space.
+            n_files = sum(len(links) for links in inode_groups.values())
+            if len(inode_groups) > 1 and file_size * (n_files - 1) >= self.min_dup_bucket_bytes:
+                potential_dups.append((file_size, list(inode_groups.values())))
+
+        # Tiered comparison: head hash -> head+tail hash -> full hash, each
+        # tier only re-reading clusters still tied after the previous one, so
+        # amortized I/O per file is the cheapest tier that resolves it. Only
+        # clusters matching on full content are ever reported, which bounds
+        # false positives at zero. Hashing is dispatched to a thread pool so
+        # several reads are in flight at once and the disk queue stays full.
+        hash_count = 0
+        hash_progress = itertools.count(1)
+
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 4) * 4)) as executor:
+
+            def refine(clusters: List[List[Tuple[str, float]]], hash_fn):
+                """Bucket link clusters by hash; keep buckets still tied."""
+                nonlocal hash_count
+                buckets: Dict[str, List[List[Tuple[str, float]]]] = defaultdict(list)
+                futures = {executor.submit(hash_fn, links[0][0]): links for links in clusters}
+                for future in as_completed(futures):
+                    digest = future.result()
+                    if digest:
+                        buckets[digest].append(futures[future])
+                        hash_count = next(hash_progress)
+                        self._progress(f"  Hashed {hash_count:,} potential duplicates...")
+                return [(digest, grp) for digest, grp in buckets.items() if len(grp) > 1]
+
+            for size, clusters in potential_dups:
+                head_cache: Dict[str, bytes] = {}
+
+                for digest, tied in refine(clusters, lambda p: self._head_hash(p, head_cache)):
+                    if size <= 4096:
+                        # The head block covers the whole file, so tier 1
+                        # already compared full content
+                        matched = [(digest, tied)]
+                    else:
+                        matched = []
+                        for _, still_tied in refine(
+                                tied, lambda p: self._head_tail_hash(p, size, head_cache)):
+                            matched.extend(refine(still_tied, self._full_hash))
+
+                    for key, matched_clusters in matched:
+                        # Expand hardlink siblings back out for display
+                        group_files = [f for links in matched_clusters for f in links]
+                        # Sort by mtime (newest first) - we'll keep the newest
+                        group_files.sort(key=lambda x: x[1], reverse=True)
+                        self.duplicates[key] = (size, [Path(f[0]) for f in group_files])
+
+        print(f"  Hashed {hash_count:,} files for duplicate detection")
+
+        # Sort result index arrays on their backing columns
+        self.large_files = _sort_indices(self.large_files, self._sizes, reverse=True)
+        self.old_files = _sort_indices(self.old_files, self._mtimes)
+
+    def format_age(self, mtime: float, now: float) -> str:
+        """Format file age from a raw epoch mtime ("now" is hoisted by the
+        caller so a listing reads the clock once, not per row)."""
+        days = int(now - mtime) // 86400
+        if days > 365:
+            years = days // 365
+            return f"{years} year{'s' if years > 1 else ''} ago"
+        elif days > 30:
+            months = days // 30
+            return f"{months} month{'s' if months > 1 else ''} ago"
+        else:
+            return f"{days} days ago"
+
+    def get_duplicate_size(self) -> int:
+        """Calculate total size of duplicate files (excluding originals)."""
+        # Sizes were captured at scan time; no syscalls here
+        return sum(size * (len(files) - 1) for size, files in self.duplicates.values())
+
+    def print_summary(self) -> None:
+        """Print summary of findings."""
+        print(f"\n{Colors.BOLD}{'=' * 70}")
+        print(f"                         SCAN SUMMARY")
+        print(f"{'=' * 70}{Colors.END}\n")
+
+        print(f"  {Colors.CYAN}Total scanned:{Colors.END} {self.files_scanned:,} files, {format_size(self.total_size_scanned)}")
+        print()
+
+        sizes = self._sizes
+        categories = [
+            ("1", "Duplicate files", len(self.duplicates), self.get_duplicate_size(), Colors.RED),
+            ("2", "Empty files", len(self.empty_files), 0, Colors.YELLOW),
+            ("3", "Empty directories", len(self.empty_dirs), 0, Colors.YELLOW),
+            ("4", "Junk files", len(self.junk_files), sum(sizes[i] for i in self.junk_files), Colors.MAGENTA),
+            ("5", "Large files (>100MB)", len(self.large_files), sum(sizes[i] for i in self.large_files), Colors.BLUE),
+            ("6", f"Old files (>{self.old_days} days)", len(self.old_files), sum(sizes[i] for i in self.old_files), Colors.GREEN),
+        ]
+
+        for num, name, count, size, color in categories:
+            if count > 0:
+                size_str = f" ({format_size(size)})" if size > 0 else ""
+                print(f"  {Colors.BOLD}[{num}]{Colors.END} {color}{name}:{Colors.END} {count:,} items{size_str}")
+            else:
+                print(f"  {Colors.DIM}[{num}] {name}: None found{Colors.END}")
+
+        print()
+
+    def print_category_details(self, category: str, limit: int = 20) -> None:
+        """Print details for a specific category."""
+        if category == "1" and self.duplicates:
+            print(f"\n{Colors.BOLD}{Colors.RED}DUPLICATE FILES{Colors.END}")
+            print(f"{Colors.DIM}(First file in each group will be KEPT, others deleted){Colors.END}\n")
+
+            shown = 0
+            for file_hash, (file_size, files) in list(self.duplicates.items())[:limit]:
+                size = format_size(file_size)
+                print(f"  {Colors.GREEN}[KEEP]{Colors.END} {files[0]}")
+                for dup in files[1:]:
+                    print(f"  {Colors.RED}[DEL]{Colors.END}  {dup}")
+                print(f"  {Colors.DIM}Size: {size}{Colors.END}\n")
+                shown += 1
+
+            if len(self.duplicates) > limit:
+                print(f"  {Colors.DIM}... and {len(self.duplicates) - limit} more duplicate groups{Colors.END}\n")
+
+        elif category == "2" and self.empty_files:
+            print(f"\n{Colors.BOLD}{Colors.YELLOW}EMPTY FILES{Colors.END}\n")
+            for i in self.empty_files[:limit]:
+                print(f"  {self._paths[i]}")
+            if len(self.empty_files) > limit:
+                print(f"  {Colors.DIM}... and {len(self.empty_files) - limit} more{Colors.END}")
+            print()
+
+        elif category == "3" and self.empty_dirs:
+            print(f"\n{Colors.BOLD}{Colors.YELLOW}EMPTY DIRECTORIES{Colors.END}\n")
+            for d in self.empty_dirs[:limit]:
+                print(f"  {d}")
+            if len(self.empty_dirs) > limit:
+                print(f"  {Colors.DIM}... and {len(self.empty_dirs) - limit} more{Colors.END}")
+            print()
+
+        elif category == "4" and self.junk_files:
+            print(f"\n{Colors.BOLD}{Colors.MAGENTA}JUNK FILES{Colors.END}\n")
+            for i in self.junk_files[:limit]:
+                size = format_size(self._sizes[i])
+                print(f"  {self._paths[i]} {Colors.DIM}({size}){Colors.END}")
+            if len(self.junk_files) > limit:
+                print(f"  {Colors.DIM}... and {len(self.junk_files) - limit} more{Colors.END}")
+            print()
+
+        elif category == "5" and self.large_files:
+            print(f"\n{Colors.BOLD}{Colors.BLUE}LARGE FILES (>100MB){Colors.END}\n")
+            for i in self.large_files[:limit]:
+                print(f"  {format_size(self._sizes[i]):>10}  {self._paths[i]}")
+            if len(self.large_files) > limit:
+                print(f"  {Colors.DIM}... and {len(self.large_files) - limit} more{Colors.END}")
+            print()
+
+        elif category == "6" and self.old_files:
+            print(f"\n{Colors.BOLD}{Colors.GREEN}OLD FILES (>{self.old_days} days){Colors.END}\n")
+            now = time.time()
+            for i in self.old_files[:limit]:
+                age = self.format_age(self._mtimes[i], now)
+                size = format_size(self._sizes[i])
+                print(f"  {age:>18}  {size:>10}  {self._paths[i]}")
+            if len(self.old_files) > limit:
+                print(f"  {Colors.DIM}... and {len(self.old_files) - limit} more{Colors.END}")
+            print()
+
+    def get_files_for_category(self, category: str) -> List[Path]:
+        """Get list of files to delete for a category."""
+        if category == "1":
+            # For duplicates, return all but the newest (first) in each group
+            files = []
+            for _, file_list in self.duplicates.values():
+                files.extend(file_list[1:])
+            return files
+        elif category == "2":
+            return [Path(self._paths[i]) for i in self.empty_files]
+        elif category == "3":
+            return self.empty_dirs
+        elif category == "4":
+            return [Path(self._paths[i]) for i in self.junk_files]
+        elif category == "5":
+            return [Path(self._paths[i]) for i in self.large_files]
+        elif category == "6":
+            return [Path(self._paths[i]) for i in self.old_files]
+        return []
+
+    def clear_category(self, category: str) -> None:
+        """Forget a category's results after it has been cleaned."""
+        if category == "1":
+            self.duplicates.clear()
+        elif category == "2":
+            self.empty_files = array.array('I')
+        elif category == "3":
+            self.empty_dirs.clear()
+        elif category == "4":
+            self.junk_files = array.array('I')
+        elif category == "5":
+            self.large_files = array.array('I')
+        elif category == "6":
+            self.old_files = array.array('I')
+
+
+class Cleaner:
+    def __init__(self, backup_dir: Path = None):
+        self.backup_dir = backup_dir
+        self.deleted_count = 0
+        self.deleted_size = 0
+        self.failed_count = 0
+        # Deletions run on a worker pool; counters and the made-dirs set
+        # are shared across workers
+        self._lock = threading.Lock()
+        self._made_dirs: Set[Path] = set()
+
+    def delete_file(self, filepath: Path, backup: bool = False) -> bool:
+        """Delete or backup a file."""
+        try:
+            # One lstat answers exists / is-dir / size in a single syscall
+            try:
+                st = os.lstat(filepath)
+            except FileNotFoundError:
+                return True
+
+            is_dir = stat.S_ISDIR(st.st_mode)
+            file_size = st.st_size if stat.S_ISREG(st.st_mode) else 0
+
+            if backup and self.backup_dir:
+                # Create backup path preserving directory structure
+                rel_path = filepath.relative_to(Path.home())
+                backup_path = self.backup_dir / rel_path
+                # Deduplicate mkdir calls across parallel workers. Dirs are
+                # published to the set only after they exist, so a miss at
+                # worst repeats a cheap exist_ok mkdir — it never lets a
+                # worker move a file into a not-yet-created directory.
+                parent = backup_path.parent
+                with self._lock:
+                    make_parent = parent not in self._made_dirs
+                if make_parent:
+                    parent.mkdir(parents=True, exist_ok=True)
+                    with self._lock:
+                        self._made_dirs.add(parent)
+
+                # Handle name conflicts
+                if backup_path.exists():
+                    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                    backup_path = backup_path.with_name(f"{backup_path.stem}_{timestamp}{backup_path.suffix}")
+
+                try:
+                    # Same filesystem: one rename syscall moves the file
+                    os.rename(filepath, backup_path)
+                except OSError:
+                    # Cross-device (or directory over file): copy + delete
+                    shutil.move(str(filepath), str(backup_path))
+            else:
+                # Bare os calls skip pathlib's per-call fspath/validation work
+                if is_dir:
+                    os.rmdir(filepath)
+                else:
+                    os.unlink(filepath)
+
+            with self._lock:
+                self.deleted_count += 1
+                self.deleted_size += file_size
+            return True
+
+        except Exception as e:
+            with self._lock:
+                self.failed_count += 1
+            return False
+
+    def clean_category(self, files: List[Path], backup: bool = False) -> Tuple[int, int, int]:
+        """Clean files in a category. Returns (deleted, failed, size)."""
+        self.deleted_count = 0
+        self.deleted_size = 0
+        self.failed_count = 0
+
+        # unlink/rename release the GIL, so a worker pool overlaps the
+        # per-file syscall latency — this matters most on network mounts
+        total = len(files)
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            futures = [executor.submit(self.delete_file, p, backup) for p in files]
+            for i, future in enumerate(as_completed(futures)):
+                future.result()
+                if (i + 1) % 50 == 0:
+                    print(f"  Progress: {i + 1}/{total}", end='\r')
+
+        print(f"  Progress: {total}/{total}  ")
+        return self.deleted_count, self.failed_count, self.deleted_size
+
+
+def confirm(message: str) -> bool:
+    """Ask user for confirmation."""
+    while True:
+        response = input(f"{message} {Colors.YELLOW}[y/N]:{Colors.END} ").strip().lower()
+        if response in ('y', 'yes'):
+            return True
+        if response in ('n', 'no', ''):
+            return False
+
+
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+_SIZE_DIVISORS = (1, 1 << 10, 1 << 20, 1 << 30, 1 << 40, 1 << 50)
+
+
+def format_size(size: int) -> str:
+    """Format size in human-readable format.
+
+    Picks the unit from bit_length instead of a divide-and-compare loop;
+    this runs once per printed row, so keep it branch-light.
+    """
+    i = min((size.bit_length() - 1) // 10, len(_SIZE_UNITS) - 1) if size else 0
+    return f"{size / _SIZE_DIVISORS[i]:.1f} {_SIZE_UNITS[i]}"
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Clean up your home directory by finding and removing unwanted files.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Categories:
+  1. Duplicates    - Files with identical content (keeps newest)
+  2. Empty files   - Zero-byte files
+  3. Empty dirs    - Directories with no content
+  4. Junk files    - .tmp, .log, .DS_Store, .bak, etc.
+  5. Large files   - Files over 100MB
+  6. Old files     - Not modified in 120+ days
+
+Examples:
+  %(prog)s                      # Scan and interactive cleanup
+  %(prog)s --backup             # Move to ~/.cleanup_backup instead of delete
+  %(prog)s --large-mb 500       # Set large file threshold to 500MB
+  %(prog)s --old-days 180       # Set old file threshold to 180 days
+        """
+    )
+
+    parser.add_argument(
+        '--path',
+        type=Path,
+        default=Path.home(),
+        help='Directory to clean (default: home directory)'
+    )
+    parser.add_argument(
+        '--backup',
+        action='store_true',
+        help='Move files to ~/.cleanup_backup instead of deleting'
+    )
+    parser.add_argument(
+        '--large-mb',
+        type=int,
+        default=100,
+        help='Threshold for large files in MB (default: 100)'
+    )
+    parser.add_argument(
+        '--old-days',
+        type=int,
+        default=120,
+        help='Threshold for old files in days (default: 120)'
+    )
+    parser.add_argument(
+        '--min-dup-bucket-bytes',
+        type=int,
+        default=1024 * 1024,
+        help='Skip duplicate detection for size buckets that could reclaim '
+             'less than this many bytes (default: 1MB)'
+    )
+    parser.add_argument(
+        '--show-all',
+        action='store_true',
+        help='Show all items (no limit) in category details'
+    )
+
+    args = parser.parse_args()
+
+    # Banner
+    print(f"\n{Colors.BOLD}{Colors.CYAN}{'=' * 70}")
+    print(f"               HOME DIRECTORY CLEANUP TOOL")
+    print(f"{'=' * 70}{Colors.END}")
+
+    if args.backup:
+        backup_dir = Path.home() / '.cleanup_backup'
+        print(f"\n{Colors.GREEN}Backup mode enabled:{Colors.END} Files will be moved to {backup_dir}")
+    else:
+        backup_dir = None
+        print(f"\n{Colors.YELLOW}Warning:{Colors.END} Files will be permanently deleted!")
+
+    # Scan
+    scanner = CleanupScanner(args.path, args.large_mb, args.old_days, args.min_dup_bucket_bytes)
+    scanner.scan()
+    scanner.print_summary()
+
+    # Check if anything was found
+    total_items = (len(scanner.duplicates) + len(scanner.empty_files) +
+                   len(scanner.empty_dirs) + len(scanner.junk_files) +
+                   len(scanner.large_files) + len(scanner.old_files))
+
+    if total_items == 0:
+        print(f"{Colors.GREEN}Your home directory is clean! Nothing to do.{Colors.END}\n")
+        return
+
+    # Interactive menu
+    cleaner = Cleaner(backup_dir)
+    display_limit = None if args.show_all else 20
+
+    while True:
+        print(f"\n{Colors.BOLD}OPTIONS:{Colors.END}")
+        print(f"  {Colors.CYAN}[1-6]{Colors.END}  View details for a category")
+        print(f"  {Colors.CYAN}[d1-d6]{Colors.END} Delete/backup items in a category")
+        print(f"  {Colors.CYAN}[a]{Colors.END}    Delete/backup ALL categories")
+        print(f"  {Colors.CYAN}[r]{Colors.END}    Rescan directory")
+        print(f"  {Colors.CYAN}[q]{Colors.END}    Quit")
+
+        choice = input(f"\n{Colors.BOLD}Enter choice:{Colors.END} ").strip().lower()
+
+        if choice == 'q':
+            print(f"\n{Colors.GREEN}Goodbye!{Colors.END}\n")
+            break
+
+        elif choice == 'r':
+            scanner = CleanupScanner(args.path, args.large_mb, args.old_days, args.min_dup_bucket_bytes)
+            scanner.scan()
+            scanner.print_summary()
+
+        elif choice in ['1', '2', '3', '4', '5', '6']:
+            scanner.print_category_details(choice, display_limit or 1000)
+
+        elif choice.startswith('d') and choice[1:] in ['1', '2', '3', '4', '5', '6']:
+            category = choice[1:]
+            files = scanner.get_files_for_category(category)
+
+            if not files:
+                print(f"\n{Colors.YELLOW}No items in this category.{Colors.END}")
+                continue
+
+            category_names = {
+                "1": "duplicate files",
+                "2": "empty files",
+                "3": "empty directories",
+                "4": "junk files",
+                "5": "large files",
+                "6": "old files"
+            }
+
+            action = "move to backup" if args.backup else "permanently delete"
+            print(f"\n{Colors.RED}About to {action} {len(files)} {category_names[category]}.{Colors.END}")
+
+            if confirm(f"Are you sure?"):
+                if args.backup:
+                    backup_dir.mkdir(parents=True, exist_ok=True)
+
+                deleted, failed, size = cleaner.clean_category(files, args.backup)
+
+                print(f"\n{Colors.GREEN}Completed:{Colors.END}")
+                print(f"  {'Moved' if args.backup else 'Deleted'}: {deleted} items ({format_size(size)})")
+                if failed:
+                    print(f"  {Colors.RED}Failed: {failed} items{Colors.END}")
+
+                # Clear the cleaned category
+                scanner.clear_category(category)
+            else:
+                print(f"\n{Colors.YELLOW}Cancelled.{Colors.END}")
+
+        elif choice == 'a':
+            all_files = []
+            for cat in ['1', '2', '3', '4', '5', '6']:
+                all_files.extend(scanner.get_files_for_category(cat))
+
+            if not all_files:
+                print(f"\n{Colors.YELLOW}Nothing to clean.{Colors.END}")
+                continue
+
+            action = "move to backup" if args.backup else "permanently delete"
+            print(f"\n{Colors.RED}About to {action} {len(all_files)} items from ALL categories.{Colors.END}")
+            print(f"{Colors.RED}This includes duplicates, empty files/dirs, junk, large, and old files!{Colors.END}")
+
+            if confirm("Are you ABSOLUTELY sure?"):
+                if confirm("Last chance - this cannot be undone. Continue?"):
+                    if args.backup:
+                        backup_dir.mkdir(parents=True, exist_ok=True)
+
+                    deleted, failed, size = cleaner.clean_category(all_files, args.backup)
+
+                    print(f"\n{Colors.GREEN}Completed:{Colors.END}")
+                    print(f"  {'Moved' if args.backup else 'Deleted'}: {deleted} items ({format_size(size)})")
+                    if failed:
+                        print(f"  {Colors.RED}Failed: {failed} items{Colors.END}")
+
+                    # Clear all categories
+                    for cat in ['1', '2', '3', '4', '5', '6']:
+                        scanner.clear_category(cat)
+                else:
+                    print(f"\n{Colors.YELLOW}Cancelled.{Colors.END}")
+            else:
+                print(f"\n{Colors.YELLOW}Cancelled.{Colors.END}")
+
+        else:
+            print(f"\n{Colors.YELLOW}Invalid choice. Try again.{Colors.END}")
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        print(f"\n\n{Colors.YELLOW}Cancelled by user.{Colors.END}\n")
+        sys.exit(0)
